@@ -2,17 +2,29 @@
 Logique métier pour l'intégration avec Google Calendar.
 """
 import os
-import json
+import asyncio
+import random
+import tempfile
 import functools
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable, Iterator
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from cachetools import TTLCache
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
 
 from app.utils.settings import get_settings
 from app.utils.logging import get_logger
@@ -26,6 +38,121 @@ SCOPES_FULL_ACCESS = ['https://www.googleapis.com/auth/calendar']
 # Adjusted paths to be relative to the app's root or a configurable base path
 TOKEN_PATH = os.path.join(settings.base_dir, settings.calendar.token_file)
 CREDENTIALS_PATH = os.path.join(settings.base_dir, settings.calendar.credentials_file)
+OAUTH_HEADLESS = getattr(settings.calendar, 'headless', False)
+
+# Paramètres lus une fois à l'import (voir reload_settings)
+_DEFAULT_CALENDAR_ID = settings.calendar.calendar_id
+_DEFAULT_TZ = settings.calendar.timezone
+_DEFAULT_READ_ONLY = settings.calendar.scopes_read_only
+
+def reload_settings() -> None:
+    """Relit les paramètres calendrier par défaut après un rechargement des settings."""
+    global settings, _DEFAULT_CALENDAR_ID, _DEFAULT_TZ, _DEFAULT_READ_ONLY
+    settings = get_settings()
+    _DEFAULT_CALENDAR_ID = settings.calendar.calendar_id
+    _DEFAULT_TZ = settings.calendar.timezone
+    _DEFAULT_READ_ONLY = settings.calendar.scopes_read_only
+
+# Caches process-wide, indexés par le flag read_only
+_CREDS_CACHE: Dict[bool, Credentials] = {}
+_SERVICE_CACHE: Dict[bool, Any] = {}
+
+# Rafraîchissement anticipé du token : marge avant expiration, verrou pour
+# dédupliquer les rafraîchissements concurrents, timer optionnel en arrière-plan.
+# La marge doit dépasser le seuil de google-auth (creds.valid passe à False 3 min 45 s
+# avant l'expiration) pour que le rafraîchissement anticipé ait lieu avant ce seuil.
+TOKEN_REFRESH_MARGIN = 300
+BACKGROUND_TOKEN_REFRESH = getattr(settings.calendar, 'background_token_refresh', False)
+_CREDS_LOCK = threading.Lock()
+
+# Transport réutilisé pour les rafraîchissements : garde la connexion vers
+# oauth2.googleapis.com ouverte au lieu d'une nouvelle session TLS à chaque fois.
+_REFRESH_SESSION = requests.Session()
+_REFRESH_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_REFRESH_REQUEST = Request(session=_REFRESH_SESSION)
+_REFRESH_TIMERS: Dict[bool, threading.Timer] = {}
+
+# Transport HTTP : httplib2.Http n'est pas thread-safe, chaque thread garde donc
+# sa propre connexion keep-alive. Le nombre de requêtes simultanées vers l'API
+# est plafonné pour rester sous la limite de connexions par utilisateur/IP de Google.
+HTTP_TIMEOUT = 30
+MAX_CONCURRENT_REQUESTS = getattr(settings.calendar, 'max_concurrent_requests', None) or 8
+_HTTP_SEMAPHORE = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+_HTTP_LOCAL = threading.local()
+
+def _get_thread_http(creds: Credentials) -> AuthorizedHttp:
+    """Retourne le transport autorisé du thread courant pour ces credentials."""
+    pool = getattr(_HTTP_LOCAL, 'pool', None)
+    if pool is None:
+        pool = _HTTP_LOCAL.pool = {}
+    entry = pool.get(id(creds))
+    if entry is None or entry[0] is not creds:
+        entry = (creds, AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT)))
+        pool[id(creds)] = entry
+    return entry[1]
+
+class _PooledHttpRequest(HttpRequest):
+    """HttpRequest exécutée sur le transport du thread courant, sous le plafond de concurrence."""
+
+    def execute(self, http=None, num_retries=0):
+        if http is None:
+            http = _get_thread_http(self.http.credentials)
+        with _HTTP_SEMAPHORE:
+            return super().execute(http=http, num_retries=num_retries)
+
+# Pool de threads partagé pour les appels indépendants (I/O-bound). La concurrence
+# effective vers l'API reste bornée par _HTTP_SEMAPHORE.
+MAX_WORKERS = getattr(settings.calendar, 'max_workers', None) or 8
+_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='calendar')
+
+# Cache court des listes d'événements, indexé par (calendar_id, count) et invalidé
+# par toute écriture sur le calendrier concerné. TTLCache n'est pas thread-safe.
+LIST_CACHE_TTL = getattr(settings.calendar, 'list_cache_ttl', 30)
+_LIST_CACHE: TTLCache = TTLCache(maxsize=128, ttl=LIST_CACHE_TTL or 1)
+_LIST_CACHE_LOCK = threading.Lock()
+
+# Appels events.list en cours, pour dédupliquer les requêtes concurrentes identiques
+_INFLIGHT: Dict[Tuple[str, int], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Génération par calendrier, incrémentée à chaque écriture : une lecture lancée avant
+# une écriture ne doit pas remettre en cache la liste d'avant l'écriture
+_LIST_GENERATIONS: Dict[str, int] = {}
+
+def _invalidate_list_cache(calendar_id: str) -> None:
+    with _LIST_CACHE_LOCK:
+        _LIST_GENERATIONS[calendar_id] = _LIST_GENERATIONS.get(calendar_id, 0) + 1
+        for key in [key for key in _LIST_CACHE.keys() if key[0] == calendar_id]:
+            _LIST_CACHE.pop(key, None)
+    # Les appels suivants ne doivent pas non plus se greffer sur une lecture antérieure
+    with _INFLIGHT_LOCK:
+        for key in [key for key in _INFLIGHT if key[0] == calendar_id]:
+            _INFLIGHT.pop(key, None)
+
+# Réponses partielles : seuls les champs utilisés par les outils sont demandés
+EVENT_FIELDS = 'id,summary,start,end,location,description'
+LIST_EVENTS_FIELDS = f'items({EVENT_FIELDS}),nextPageToken'
+
+# Pagination de events.list : taille de page et pool dédié au préchargement de la
+# page suivante (séparé de _EXECUTOR pour ne jamais attendre une tâche du même pool).
+LIST_PAGE_SIZE = 250
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='calendar-prefetch')
+
+# Taille maximale d'une requête batch Google Calendar
+BATCH_MAX_SIZE = 50
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def _retry_after(error: Exception) -> float:
+    """Délai (secondes) imposé par l'en-tête Retry-After d'une réponse, 0 si absent ou non numérique."""
+    resp = getattr(error, 'resp', None)
+    try:
+        return float(resp.get('retry-after', 0)) if resp is not None else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+def _backoff_delay(delay: float, retries: int, retry_after: float = 0.0) -> float:
+    """Backoff exponentiel avec jitter, jamais inférieur au Retry-After du serveur."""
+    return max(retry_after, delay * (2 ** (retries - 1))) * random.uniform(0.8, 1.2)
 
 def with_retry(max_retries: int = 3, delay: float = 1.0):
     def decorator(func):
@@ -37,7 +164,7 @@ def with_retry(max_retries: int = 3, delay: float = 1.0):
                     return func(*args, **kwargs)
                 except HttpError as e:
                     status_code = e.resp.status if hasattr(e, 'resp') else 0
-                    if status_code in (400, 401, 403, 404):
+                    if status_code not in _RETRYABLE_STATUS_CODES:
                         logger.error(f"Erreur HTTP {status_code} non réessayable: {e}")
                         raise
                     retries += 1
@@ -45,45 +172,136 @@ def with_retry(max_retries: int = 3, delay: float = 1.0):
                         logger.error(f"Échec après {max_retries} tentatives - Erreur HTTP {status_code}: {e}")
                         raise
                     logger.warning(f"Tentative {retries}/{max_retries} échouée - Erreur HTTP {status_code}: {e}")
-                    time.sleep(delay * (2 ** (retries - 1)))
+                    time.sleep(_backoff_delay(delay, retries, _retry_after(e)))
+                except ValueError:
+                    # Erreur déterministe (ex. 404 traduit en ValueError, date invalide) : jamais réessayée
+                    raise
                 except Exception as e:
                     retries += 1
                     if retries > max_retries:
                         logger.error(f"Échec après {max_retries} tentatives: {e}")
                         raise
                     logger.warning(f"Tentative {retries}/{max_retries} échouée: {e}")
-                    time.sleep(delay)
+                    time.sleep(delay * random.uniform(0.8, 1.2))
         return wrapper
     return decorator
 
+def _needs_refresh(creds: Credentials) -> bool:
+    """True si le token expire dans moins de TOKEN_REFRESH_MARGIN secondes."""
+    if not creds.expiry:
+        return False
+    remaining = creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None) # expiry est en UTC naïf
+    return remaining.total_seconds() < TOKEN_REFRESH_MARGIN
+
+def _not_expired(creds: Credentials) -> bool:
+    """True tant que l'expiration réelle du token n'est pas atteinte (creds.valid inclut la marge de google-auth)."""
+    if not creds.token:
+        return False
+    if not creds.expiry:
+        return True
+    return creds.expiry > datetime.now(timezone.utc).replace(tzinfo=None)
+
+def _schedule_refresh(creds: Credentials, read_only: bool) -> None:
+    """Programme un rafraîchissement en arrière-plan juste avant l'expiration du token."""
+    if not BACKGROUND_TOKEN_REFRESH or not creds.expiry or not creds.refresh_token:
+        return
+    previous = _REFRESH_TIMERS.get(read_only)
+    if previous is not None:
+        previous.cancel()
+    remaining = (creds.expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+    timer = threading.Timer(max(remaining - TOKEN_REFRESH_MARGIN, 0) + 1,
+                            _background_refresh, args=(read_only,))
+    timer.daemon = True
+    timer.start()
+    _REFRESH_TIMERS[read_only] = timer
+
+def _background_refresh(read_only: bool) -> None:
+    """Cible du timer : rafraîchit le token en cache sans jamais relancer le flux OAuth."""
+    with _CREDS_LOCK:
+        creds = _CREDS_CACHE.get(read_only)
+        if not creds or not creds.refresh_token or not _needs_refresh(creds):
+            return
+        try:
+            creds.refresh(_REFRESH_REQUEST)
+            logger.debug("Token rafraîchi en arrière-plan")
+        except Exception as e:
+            logger.warning(f"Échec du rafraîchissement du token en arrière-plan: {e}")
+            return
+        _save_token(creds)
+        _schedule_refresh(creds, read_only)
+
+def _save_token(creds: Credentials) -> None:
+    """
+    Écrit le token dans un fichier temporaire puis le renomme atomiquement sur TOKEN_PATH,
+    pour qu'une interruption en cours d'écriture ne laisse jamais un token corrompu.
+    Toujours appelé sous _CREDS_LOCK : un seul écrivain à la fois.
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(TOKEN_PATH), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as token_file:
+            token_file.write(creds.to_json().encode('utf-8'))
+            token_file.flush()
+            os.fsync(token_file.fileno())
+        os.replace(tmp_path, TOKEN_PATH)
+        logger.debug(f"Token sauvegardé dans {TOKEN_PATH}")
+    except Exception as e:
+        logger.warning(f"Impossible de sauvegarder le token dans {TOKEN_PATH}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
 def get_credentials(read_only: bool = None) -> Credentials:
     if read_only is None:
-        read_only = settings.calendar.scopes_read_only
+        read_only = _DEFAULT_READ_ONLY
+
+    creds = _CREDS_CACHE.get(read_only)
+    if creds and creds.valid and not _needs_refresh(creds):
+        return creds
+
+    with _CREDS_LOCK:
+        # Un autre thread a pu rafraîchir le token pendant l'attente du verrou
+        creds = _CREDS_CACHE.get(read_only)
+        if creds and creds.valid and not _needs_refresh(creds):
+            return creds
+        return _load_credentials(read_only, creds)
+
+def _load_credentials(read_only: bool, creds: Optional[Credentials]) -> Credentials:
     scopes = SCOPES_READ_ONLY if read_only else SCOPES_FULL_ACCESS
-    creds = None
 
     token_dir = os.path.dirname(TOKEN_PATH)
-    if not os.path.exists(token_dir):
-        os.makedirs(token_dir, exist_ok=True)
+    try:
+        os.makedirs(token_dir)
         logger.info(f"Création du répertoire pour le token: {token_dir}")
+    except FileExistsError:
+        pass
 
-    if os.path.exists(TOKEN_PATH):
+    if not creds:
         try:
-            with open(TOKEN_PATH, 'r') as token_file:
-                creds_data = json.load(token_file)
+            with open(TOKEN_PATH, 'rb') as token_file:
+                creds_data = orjson.loads(token_file.read())
             creds = Credentials.from_authorized_user_info(creds_data, scopes)
             logger.debug("Token chargé depuis le fichier")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Erreur lors du chargement du token depuis {TOKEN_PATH}: {e}")
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+
+    if not creds or not creds.valid or _needs_refresh(creds):
+        token_changed = True
+        if creds and creds.refresh_token and (creds.expired or _needs_refresh(creds)):
             try:
-                creds.refresh(Request())
+                creds.refresh(_REFRESH_REQUEST)
+                _SERVICE_CACHE.pop(read_only, None)
                 logger.debug("Token rafraîchi avec succès")
             except Exception as e:
-                logger.error(f"Erreur lors du rafraîchissement du token: {e}")
-                creds = None
+                if _not_expired(creds):
+                    # Rafraîchissement raté mais token pas encore réellement expiré : on le garde
+                    # (nouvelle tentative au prochain appel), jamais de flux OAuth interactif
+                    logger.warning(f"Échec du rafraîchissement, token non expiré conservé: {e}")
+                    token_changed = False
+                else:
+                    logger.error(f"Erreur lors du rafraîchissement du token: {e}")
+                    creds = None
         
         if not creds:
             if not os.path.exists(CREDENTIALS_PATH):
@@ -94,26 +312,55 @@ def get_credentials(read_only: bool = None) -> Credentials:
                 )
             try:
                 flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, scopes)
-                # Utiliser run_console pour éviter le besoin d'un serveur local si l'app est headless
-                creds = flow.run_console()
-                logger.info("Nouvelles autorisations obtenues via la console")
+                # access_type='offline' + prompt='consent' : garantit un refresh token, les
+                # renouvellements suivants se font alors sans repasser par ce flux
+                if OAUTH_HEADLESS and hasattr(flow, 'run_console'):
+                    # run_console n'existe plus depuis google-auth-oauthlib 1.0 : seulement si disponible
+                    creds = flow.run_console(access_type='offline', prompt='consent')
+                    logger.info("Nouvelles autorisations obtenues via la console")
+                else:
+                    # En headless, pas de navigateur : l'URL d'autorisation est affichée à ouvrir ailleurs
+                    creds = flow.run_local_server(port=0, open_browser=not OAUTH_HEADLESS,
+                                                  access_type='offline', prompt='consent')
+                    logger.info("Nouvelles autorisations obtenues via le serveur local")
             except Exception as e:
                 logger.error(f"Erreur lors de l'authentification OAuth: {e}")
                 raise
         
-        try:
-            with open(TOKEN_PATH, 'w') as token_file:
-                token_file.write(creds.to_json())
-            logger.debug(f"Token sauvegardé dans {TOKEN_PATH}")
-        except Exception as e:
-            logger.warning(f"Impossible de sauvegarder le token dans {TOKEN_PATH}: {e}")
-    
+        if token_changed:
+            _save_token(creds)
+            _schedule_refresh(creds, read_only)
+
+    if _CREDS_CACHE.get(read_only) is not creds:
+        _SERVICE_CACHE.pop(read_only, None)
+    _CREDS_CACHE[read_only] = creds
     return creds
 
+_DISCOVERY_DOC: Optional[str] = None
+
+def _get_discovery_doc() -> Optional[str]:
+    """Document de découverte Calendar v3 figé dans google-api-python-client, lu une seule fois."""
+    global _DISCOVERY_DOC
+    if _DISCOVERY_DOC is None:
+        _DISCOVERY_DOC = get_static_doc('calendar', 'v3')
+    return _DISCOVERY_DOC
+
 def get_calendar_service(read_only: bool = None) -> Any:
+    if read_only is None:
+        read_only = _DEFAULT_READ_ONLY
     try:
         creds = get_credentials(read_only=read_only)
-        service = build('calendar', 'v3', credentials=creds, cache_discovery=False) # Disable cache for server environments
+        service = _SERVICE_CACHE.get(read_only)
+        if service is None:
+            discovery_doc = _get_discovery_doc()
+            if discovery_doc:
+                service = build_from_document(discovery_doc, http=_get_thread_http(creds),
+                                              requestBuilder=_PooledHttpRequest)
+            else:
+                service = build('calendar', 'v3', http=_get_thread_http(creds),
+                                requestBuilder=_PooledHttpRequest,
+                                cache_discovery=False) # Disable cache for server environments
+            _SERVICE_CACHE[read_only] = service
         return service
     except Exception as e:
         logger.error(f"Erreur lors de la création du service Calendar: {e}")
@@ -121,74 +368,141 @@ def get_calendar_service(read_only: bool = None) -> Any:
 
 # --- Core Logic Functions (called by tools) ---
 
-@with_retry()
-def core_list_events(count: int, calendar_id: Optional[str]) -> List[Dict[str, Any]]:
-    effective_calendar_id = calendar_id or settings.calendar.calendar_id
-    logger.info(f"Récupération de {count} événements du calendrier {effective_calendar_id}")
+def _build_event_body(summary: str, start_time: str, end_time: str,
+                      description: Optional[str] = None, location: Optional[str] = None,
+                      attendees: Optional[List[str]] = None) -> Dict[str, Any]:
+    return {
+        'summary': summary,
+        'location': location,
+        'description': description,
+        'start': {'dateTime': start_time, 'timeZone': _DEFAULT_TZ},
+        'end': {'dateTime': end_time, 'timeZone': _DEFAULT_TZ},
+        'attendees': [{'email': email} for email in attendees] if attendees else []
+    }
+
+def core_iter_events(count: int, calendar_id: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Itère sur les `count` prochains événements page par page (pageToken).
+    La page suivante est demandée en arrière-plan pendant que la page courante est consommée.
+    """
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
     service = get_calendar_service(read_only=True)
-    now = datetime.utcnow().isoformat() + 'Z'
-    events_result = service.events().list(
+    now = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+    request = service.events().list(
         calendarId=effective_calendar_id, timeMin=now,
-        maxResults=count, singleEvents=True, orderBy='startTime'
-    ).execute()
-    return events_result.get('items', [])
+        maxResults=min(count, LIST_PAGE_SIZE), singleEvents=True, orderBy='startTime',
+        fields=LIST_EVENTS_FIELDS
+    )
+    response = request.execute()
+    remaining = count
+    while True:
+        next_request = service.events().list_next(request, response)
+        next_page = None
+        if next_request is not None and remaining > len(response.get('items', [])):
+            next_page = _PREFETCH_EXECUTOR.submit(next_request.execute)
+        for event in response.get('items', []):
+            if remaining <= 0:
+                return
+            remaining -= 1
+            yield event
+        if next_page is None or remaining <= 0:
+            return
+        request, response = next_request, next_page.result()
+
+def _fetch_events(calendar_id: str, count: int) -> List[Dict[str, Any]]:
+    logger.info(f"Récupération de {count} événements du calendrier {calendar_id}")
+    return list(core_iter_events(count, calendar_id))
+
+@with_retry()
+def core_list_events(count: int, calendar_id: Optional[str]) -> List[Dict[str, Any]]:
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
+    cache_key = (effective_calendar_id, count)
+    if LIST_CACHE_TTL:
+        with _LIST_CACHE_LOCK:
+            cached = _LIST_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Événements de {effective_calendar_id} servis depuis le cache")
+            return cached
+
+    # Single-flight : un seul appel API par clé, les appels concurrents identiques attendent son résultat
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(cache_key)
+        is_leader = future is None
+        if is_leader:
+            future = _INFLIGHT[cache_key] = Future()
+    if not is_leader:
+        logger.debug(f"Requête identique en cours pour {effective_calendar_id}, attente de son résultat")
+        return future.result()
+
+    try:
+        with _LIST_CACHE_LOCK:
+            generation = _LIST_GENERATIONS.get(effective_calendar_id, 0)
+        events = _fetch_events(effective_calendar_id, count)
+        if LIST_CACHE_TTL:
+            with _LIST_CACHE_LOCK:
+                if _LIST_GENERATIONS.get(effective_calendar_id, 0) == generation:
+                    _LIST_CACHE[cache_key] = events
+        future.set_result(events)
+        return events
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            if _INFLIGHT.get(cache_key) is future: # Pas celui d'un nouveau leader après invalidation
+                _INFLIGHT.pop(cache_key, None)
 
 @with_retry()
 def core_create_event(summary: str, start_time: str, end_time: str,
                       description: Optional[str], location: Optional[str],
                       attendees: Optional[List[str]], calendar_id: Optional[str]) -> Dict[str, Any]:
-    effective_calendar_id = calendar_id or settings.calendar.calendar_id
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
     service = get_calendar_service(read_only=False)
-    event_body = {
-        'summary': summary,
-        'location': location,
-        'description': description,
-        'start': {'dateTime': start_time, 'timeZone': settings.calendar.timezone},
-        'end': {'dateTime': end_time, 'timeZone': settings.calendar.timezone},
-        'attendees': [{'email': email} for email in attendees] if attendees else []
-    }
+    event_body = _build_event_body(summary, start_time, end_time, description, location, attendees)
     created_event = service.events().insert(calendarId=effective_calendar_id, body=event_body).execute()
+    _invalidate_list_cache(effective_calendar_id)
     logger.info(f"Événement créé: {created_event.get('id')} dans {effective_calendar_id}")
     return created_event
 
 @with_retry()
 def core_update_event(event_id: str, calendar_id: Optional[str],
                       updates: Dict[str, Any]) -> Dict[str, Any]:
-    effective_calendar_id = calendar_id or settings.calendar.calendar_id
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
     service = get_calendar_service(read_only=False)
-    
-    # Fetch the existing event first to ensure it exists
-    try:
-        existing_event = service.events().get(calendarId=effective_calendar_id, eventId=event_id).execute()
-    except HttpError as e:
-        if e.resp.status == 404:
-            logger.error(f"Événement {event_id} non trouvé dans {effective_calendar_id} pour mise à jour.")
-            raise ValueError(f"Événement {event_id} non trouvé.")
-        raise
 
     event_body = {}
     if 'summary' in updates: event_body['summary'] = updates['summary']
     if 'description' in updates: event_body['description'] = updates['description']
     if 'location' in updates: event_body['location'] = updates['location']
-    if 'start_time' in updates: event_body['start'] = {'dateTime': updates['start_time'], 'timeZone': settings.calendar.timezone}
-    if 'end_time' in updates: event_body['end'] = {'dateTime': updates['end_time'], 'timeZone': settings.calendar.timezone}
+    if 'start_time' in updates: event_body['start'] = {'dateTime': updates['start_time'], 'timeZone': _DEFAULT_TZ}
+    if 'end_time' in updates: event_body['end'] = {'dateTime': updates['end_time'], 'timeZone': _DEFAULT_TZ}
     if 'attendees' in updates and updates['attendees'] is not None:
         event_body['attendees'] = [{'email': email} for email in updates['attendees']]
-    
-    if not event_body:
-        logger.info(f"Aucune mise à jour fournie pour l'événement {event_id}")
-        return existing_event # Return existing if no actual changes are made
 
-    updated_event = service.events().patch(calendarId=effective_calendar_id, eventId=event_id, body=event_body).execute()
+    # Le PATCH renvoie déjà un 404 si l'événement n'existe pas : pas de GET préalable,
+    # sauf quand il n'y a rien à modifier et qu'on retourne l'événement existant.
+    try:
+        if not event_body:
+            logger.info(f"Aucune mise à jour fournie pour l'événement {event_id}")
+            return service.events().get(calendarId=effective_calendar_id, eventId=event_id,
+                                        fields=EVENT_FIELDS).execute()
+        updated_event = service.events().patch(calendarId=effective_calendar_id, eventId=event_id, body=event_body).execute()
+    except HttpError as e:
+        if e.resp.status == 404:
+            logger.error(f"Événement {event_id} non trouvé dans {effective_calendar_id} pour mise à jour.")
+            raise ValueError(f"Événement {event_id} non trouvé.")
+        raise
+    _invalidate_list_cache(effective_calendar_id)
     logger.info(f"Événement {event_id} mis à jour dans {effective_calendar_id}")
     return updated_event
 
 @with_retry()
 def core_delete_event(event_id: str, calendar_id: Optional[str]) -> bool:
-    effective_calendar_id = calendar_id or settings.calendar.calendar_id
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
     service = get_calendar_service(read_only=False)
     try:
         service.events().delete(calendarId=effective_calendar_id, eventId=event_id).execute()
+        _invalidate_list_cache(effective_calendar_id)
         logger.info(f"Événement {event_id} supprimé de {effective_calendar_id}")
         return True
     except HttpError as e:
@@ -199,4 +513,114 @@ def core_delete_event(event_id: str, calendar_id: Optional[str]) -> bool:
         raise
     except Exception as e:
         logger.error(f"Erreur inattendue lors de la suppression de l'événement {event_id}: {e}")
-        raise 
\ No newline at end of file
+        raise
+
+def core_batch_create_events(events: List[Dict[str, Any]], calendar_id: Optional[str],
+                             max_retries: int = 3, delay: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Crée plusieurs événements via des requêtes batch (BATCH_MAX_SIZE sous-requêtes par appel HTTP).
+    Les sous-requêtes en échec 429/5xx sont re-batchées avec un backoff exponentiel.
+    Retourne une liste alignée sur `events` : l'événement créé, ou {'error': ...} en cas d'échec.
+    """
+    effective_calendar_id = calendar_id or _DEFAULT_CALENDAR_ID
+    service = get_calendar_service(read_only=False)
+    http = _get_thread_http(get_credentials(read_only=False))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(events)
+    pending = list(range(len(events)))
+    attempt = 0
+
+    try:
+        while pending:
+            failed: List[int] = []
+            retry_after = 0.0
+
+            def callback(request_id, response, exception):
+                nonlocal retry_after
+                index = int(request_id)
+                if exception is None:
+                    results[index] = response
+                    return
+                status_code = exception.resp.status if isinstance(exception, HttpError) else 0
+                if status_code in _RETRYABLE_STATUS_CODES and attempt < max_retries:
+                    failed.append(index)
+                    retry_after = max(retry_after, _retry_after(exception))
+                else:
+                    logger.error(f"Échec de création de l'événement #{index} dans {effective_calendar_id}: {exception}")
+                    results[index] = {'error': str(exception)}
+
+            for start in range(0, len(pending), BATCH_MAX_SIZE):
+                batch = service.new_batch_http_request(callback=callback)
+                chunk = pending[start:start + BATCH_MAX_SIZE]
+                for index in chunk:
+                    body = _build_event_body(**events[index])
+                    batch.add(service.events().insert(calendarId=effective_calendar_id, body=body),
+                              request_id=str(index))
+                try:
+                    with _HTTP_SEMAPHORE:
+                        batch.execute(http=http)
+                except Exception as e:
+                    # Erreur de transport ou 429/5xx sur le batch entier : seules les sous-requêtes
+                    # sans résultat sont concernées, les résultats déjà obtenus sont conservés
+                    status_code = e.resp.status if isinstance(e, HttpError) else 0
+                    retryable = (status_code in _RETRYABLE_STATUS_CODES or not isinstance(e, HttpError))
+                    for index in chunk:
+                        if results[index] is not None or index in failed:
+                            continue
+                        if retryable and attempt < max_retries:
+                            failed.append(index)
+                        else:
+                            logger.error(f"Échec de création de l'événement #{index} dans {effective_calendar_id}: {e}")
+                            results[index] = {'error': str(e)}
+                    retry_after = max(retry_after, _retry_after(e))
+
+            if failed:
+                attempt += 1
+                logger.warning(f"Tentative {attempt}/{max_retries} : {len(failed)} créations à réessayer")
+                time.sleep(_backoff_delay(delay, attempt, retry_after))
+            pending = sorted(failed)
+    finally:
+        # Même si une exception remonte, des événements ont pu être créés : le cache doit le refléter
+        _invalidate_list_cache(effective_calendar_id)
+    created = sum(1 for r in results if r and 'error' not in r)
+    logger.info(f"{created}/{len(events)} événements créés en batch dans {effective_calendar_id}")
+    return results
+
+def core_map(fn: Callable[..., Any], args_iter: Iterable[Tuple[Any, ...]]) -> List[Any]:
+    """
+    Exécute `fn(*args)` en parallèle pour chaque tuple de `args_iter` sur le pool partagé.
+    Les résultats sont retournés dans l'ordre ; une exception levée prend la place de son résultat.
+    """
+    futures = [_EXECUTOR.submit(fn, *args) for args in args_iter]
+    results: List[Any] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+def core_delete_events(event_ids: List[str], calendar_id: Optional[str]) -> List[Any]:
+    """Supprime plusieurs événements en parallèle. Voir `core_map` pour la forme du résultat."""
+    return core_map(core_delete_event, ((event_id, calendar_id) for event_id in event_ids))
+
+# --- Variantes asynchrones : exécutent les appels bloquants sur le pool partagé ---
+
+async def _run_in_executor(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(fn, *args, **kwargs))
+
+async def acore_list_events(count: int, calendar_id: Optional[str]) -> List[Dict[str, Any]]:
+    return await _run_in_executor(core_list_events, count, calendar_id)
+
+async def acore_create_event(summary: str, start_time: str, end_time: str,
+                             description: Optional[str], location: Optional[str],
+                             attendees: Optional[List[str]], calendar_id: Optional[str]) -> Dict[str, Any]:
+    return await _run_in_executor(core_create_event, summary, start_time, end_time,
+                                  description, location, attendees, calendar_id)
+
+async def acore_update_event(event_id: str, calendar_id: Optional[str],
+                             updates: Dict[str, Any]) -> Dict[str, Any]:
+    return await _run_in_executor(core_update_event, event_id, calendar_id, updates)
+
+async def acore_delete_event(event_id: str, calendar_id: Optional[str]) -> bool:
+    return await _run_in_executor(core_delete_event, event_id, calendar_id)
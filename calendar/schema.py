@@ -21,6 +21,22 @@ class CreateEventSchema(BaseModel):
     calendar_id: Optional[str] = Field(None, description="ID du calendrier (utilise les paramètres par défaut si None)")
 
 
+class BatchEventSchema(BaseModel):
+    """Schéma d'un événement dans une création groupée."""
+    summary: str = Field(..., description="Titre de l'événement")
+    start_time: str = Field(..., description="Date et heure de début (format ISO: 2023-12-24T15:00:00)")
+    end_time: str = Field(..., description="Date et heure de fin (format ISO: 2023-12-24T16:00:00)")
+    description: Optional[str] = Field(None, description="Description de l'événement")
+    location: Optional[str] = Field(None, description="Lieu de l'événement")
+    attendees: Optional[List[str]] = Field(None, description="Liste des emails des participants")
+
+
+class BatchCreateEventsSchema(BaseModel):
+    """Schéma pour créer plusieurs événements en une seule opération."""
+    events: List[BatchEventSchema] = Field(..., description="Liste des événements à créer")
+    calendar_id: Optional[str] = Field(None, description="ID du calendrier (utilise les paramètres par défaut si None)")
+
+
 class UpdateEventSchema(BaseModel):
     """Schéma pour mettre à jour un événement existant."""
     event_id: str = Field(..., description="ID de l'événement à modifier")
@@ -36,4 +52,10 @@ class UpdateEventSchema(BaseModel):
 class DeleteEventSchema(BaseModel):
     """Schéma pour supprimer un événement."""
     event_id: str = Field(..., description="ID de l'événement à supprimer")
-    calendar_id: Optional[str] = Field(None, description="ID du calendrier (utilise les paramètres par défaut si None)") 
\ No newline at end of file
+    calendar_id: Optional[str] = Field(None, description="ID du calendrier (utilise les paramètres par défaut si None)")
+
+
+class DeleteEventsSchema(BaseModel):
+    """Schéma pour supprimer plusieurs événements."""
+    event_ids: List[str] = Field(..., description="IDs des événements à supprimer")
+    calendar_id: Optional[str] = Field(None, description="ID du calendrier (utilise les paramètres par défaut si None)")
\ No newline at end of file
@@ -1,6 +1,8 @@
 """
 Outils Langchain pour interagir avec Google Calendar.
 """
+import sys
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 
@@ -10,30 +12,71 @@ from app.utils.settings import get_settings # To access default calendar_id and
 from .core import (
     core_list_events,
     core_create_event,
+    core_batch_create_events,
     core_update_event,
-    core_delete_event
+    core_delete_event,
+    core_delete_events
 )
 from .schema import (
     ListEventsSchema,
     CreateEventSchema,
+    BatchCreateEventsSchema,
     UpdateEventSchema,
-    DeleteEventSchema
+    DeleteEventSchema,
+    DeleteEventsSchema
 )
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# datetime.fromisoformat accepte le suffixe 'Z' à partir de Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=1024)
 def _format_datetime(dt_str: str) -> str:
     """Helper to format datetime strings for display."""
     if 'T' in dt_str: # Datetime string
-        dt_obj = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
+        if not _FROMISOFORMAT_ACCEPTS_Z:
+            dt_str = dt_str.replace('Z', '+00:00')
+        dt_obj = datetime.fromisoformat(dt_str)
         return dt_obj.strftime('%d/%m/%Y %H:%M %Z')
     else: # Date string
         dt_obj = datetime.fromisoformat(dt_str)
         return dt_obj.strftime('%d/%m/%Y')
 
+def _event_to_dict(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Aplatit un événement de l'API en dictionnaire sérialisable (dates ISO brutes)."""
+    start_info = event.get('start', {})
+    end_info = event.get('end', {})
+    return {
+        'id': event.get('id'),
+        'summary': event.get('summary', 'Sans titre'),
+        'start': start_info.get('dateTime', start_info.get('date')),
+        'end': end_info.get('dateTime', end_info.get('date')),
+        'location': event.get('location'),
+        'description': event.get('description'),
+    }
+
+def render_events(events: List[Dict[str, Any]]) -> str:
+    """Mise en forme lisible des événements renvoyés par `lister_evenements_calendrier` (clé "events")."""
+    if not events:
+        return "Aucun événement à venir trouvé."
+    parts = [f"Prochains événements ({len(events)}):\n"]
+    for event in events:
+        parts.append(f"  - {event['summary']}\n")
+        if event['start']:
+            parts.append(f"    Début: {_format_datetime(event['start'])}\n")
+        if event['end']:
+            parts.append(f"    Fin:   {_format_datetime(event['end'])}\n")
+        if event['location']:
+            parts.append(f"    Lieu:  {event['location']}\n")
+        if event['description']:
+            parts.append(f"    Desc:  {event['description'][:50]}...\n")
+        parts.append(f"    ID:    {event['id']}\n\n")
+    return ''.join(parts).strip()
+
 @register(name="lister_evenements_calendrier", args_schema=ListEventsSchema)
-def lister_evenements_calendrier(count: int = 10, calendar_id: Optional[str] = None) -> str:
+def lister_evenements_calendrier(count: int = 10, calendar_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Récupère les N prochains événements du calendrier Google spécifié.
 
@@ -42,32 +85,17 @@ def lister_evenements_calendrier(count: int = 10, calendar_id: Optional[str] = N
         calendar_id: ID du calendrier (défaut: calendrier principal des settings).
 
     Returns:
-        Liste formatée des événements ou message d'erreur/succès.
+        {"success": True, "events": [...]} avec pour chaque événement id, summary, start, end,
+        location et description (dates ISO), ou {"success": False, "error": "..."}.
+        Utiliser `render_events(result["events"])` pour un affichage lisible.
     """
     logger.info(f"Tool 'lister_evenements_calendrier' appelé avec count={count}, calendar_id={calendar_id}")
     try:
         events = core_list_events(count=count, calendar_id=calendar_id)
-        if not events:
-            return "Aucun événement à venir trouvé."
-        
-        output = f"Prochains événements ({len(events)}):\n"
-        for event in events:
-            start = event.get('start', {}).get('dateTime', event.get('start', {}).get('date'))
-            end = event.get('end', {}).get('dateTime', event.get('end', {}).get('date'))
-            output += f"  - {event.get('summary', 'Sans titre')}\n"
-            if start:
-                output += f"    Début: {_format_datetime(start)}\n"
-            if end:
-                output += f"    Fin:   {_format_datetime(end)}\n"
-            if event.get('location'):
-                output += f"    Lieu:  {event.get('location')}\n"
-            if event.get('description'):
-                output += f"    Desc:  {event.get('description')[:50]}...\n"
-            output += f"    ID:    {event.get('id')}\n\n"
-        return output.strip()
+        return {"success": True, "events": [_event_to_dict(event) for event in events]}
     except Exception as e:
         logger.error(f"Erreur dans lister_evenements_calendrier: {e}", exc_info=True)
-        return f"Erreur lors de la récupération des événements: {str(e)}"
+        return {"success": False, "error": f"Erreur lors de la récupération des événements: {str(e)}"}
 
 @register(name="creer_evenement_calendrier", args_schema=CreateEventSchema)
 def creer_evenement_calendrier(summary: str, start_time: str, end_time: str,
@@ -104,6 +132,36 @@ def creer_evenement_calendrier(summary: str, start_time: str, end_time: str,
         logger.error(f"Erreur dans creer_evenement_calendrier: {e}", exc_info=True)
         return f"Erreur lors de la création de l'événement: {str(e)}"
 
+@register(name="batch_creer_evenements_calendrier", args_schema=BatchCreateEventsSchema)
+def batch_creer_evenements_calendrier(events: List[Dict[str, Any]], calendar_id: Optional[str] = None) -> str:
+    """
+    Crée plusieurs événements dans le calendrier Google en regroupant les appels API.
+
+    Args:
+        events: Liste d'événements (summary, start_time, end_time, description, location, attendees).
+        calendar_id: ID du calendrier (défaut: calendrier principal des settings).
+
+    Returns:
+        Récapitulatif des événements créés et des échecs éventuels.
+    """
+    logger.info(f"Tool 'batch_creer_evenements_calendrier' appelé pour {len(events)} événements")
+    if not events:
+        return "Aucun événement à créer."
+    try:
+        results = core_batch_create_events(events=[dict(event) for event in events], calendar_id=calendar_id)
+        created = [r for r in results if 'error' not in r]
+        parts = [f"{len(created)}/{len(results)} événement(s) créé(s):\n"]
+        for event, result in zip(events, results):
+            summary = dict(event).get('summary')
+            if 'error' in result:
+                parts.append(f"  - '{summary}': Erreur: {result['error']}\n")
+            else:
+                parts.append(f"  - '{summary}': ID: {result.get('id')}\n")
+        return ''.join(parts).strip()
+    except Exception as e:
+        logger.error(f"Erreur dans batch_creer_evenements_calendrier: {e}", exc_info=True)
+        return f"Erreur lors de la création groupée des événements: {str(e)}"
+
 @register(name="mettre_a_jour_evenement_calendrier", args_schema=UpdateEventSchema)
 def mettre_a_jour_evenement_calendrier(event_id: str, calendar_id: Optional[str] = None,
                                    summary: Optional[str] = None, start_time: Optional[str] = None,
@@ -167,4 +225,35 @@ def supprimer_evenement_calendrier(event_id: str, calendar_id: Optional[str] = N
             return f"Événement {event_id} non trouvé ou déjà supprimé."
     except Exception as e:
         logger.error(f"Erreur dans supprimer_evenement_calendrier: {e}", exc_info=True)
-        return f"Erreur lors de la suppression de l'événement {event_id}: {str(e)}" 
\ No newline at end of file
+        return f"Erreur lors de la suppression de l'événement {event_id}: {str(e)}"
+
+@register(name="supprimer_evenements_calendrier", args_schema=DeleteEventsSchema)
+def supprimer_evenements_calendrier(event_ids: List[str], calendar_id: Optional[str] = None) -> str:
+    """
+    Supprime plusieurs événements du calendrier Google en parallèle.
+
+    Args:
+        event_ids: IDs des événements à supprimer.
+        calendar_id: ID du calendrier (défaut: calendrier principal des settings).
+
+    Returns:
+        Récapitulatif des suppressions ou message d'erreur.
+    """
+    logger.info(f"Tool 'supprimer_evenements_calendrier' appelé pour {len(event_ids)} événements")
+    if not event_ids:
+        return "Aucun événement à supprimer."
+    try:
+        results = core_delete_events(event_ids=event_ids, calendar_id=calendar_id)
+        deleted = sum(1 for r in results if r is True)
+        parts = [f"{deleted}/{len(event_ids)} événement(s) supprimé(s):\n"]
+        for event_id, result in zip(event_ids, results):
+            if isinstance(result, Exception):
+                parts.append(f"  - {event_id}: Erreur: {str(result)}\n")
+            elif result:
+                parts.append(f"  - {event_id}: supprimé\n")
+            else:
+                parts.append(f"  - {event_id}: non trouvé ou déjà supprimé\n")
+        return ''.join(parts).strip()
+    except Exception as e:
+        logger.error(f"Erreur dans supprimer_evenements_calendrier: {e}", exc_info=True)
+        return f"Erreur lors de la suppression des événements: {str(e)}"
\ No newline at end of file
@@ -2,19 +2,28 @@
 Logique métier pour les outils de communication (WhatsApp, Email).
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
 import functools
 import time
 import smtplib
 import imaplib
 import email
+import base64
 import os
+import re
+import random
+import atexit
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email.mime.nonmultipart import MIMENonMultipart
 from email.header import decode_header
+from email.parser import BytesParser
 from email.utils import formataddr
 from datetime import datetime, timezone # Python 3.9+ can use ZoneInfo
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from app.utils.settings import get_settings
 from app.utils.logging import get_logger
@@ -22,110 +31,200 @@ from app.utils.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
-def with_retry(max_retries: int = 3, delay: float = 1.0):
+# Backoff : plafond d'une attente entre deux tentatives
+RETRY_BACKOFF_CAP = 30.0
+
+def _backoff_delay(delay: float, retries: int) -> float:
+    """Backoff exponentiel à « full jitter » : attente uniforme entre 0 et min(cap, delay * 2^n)."""
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, delay * (2 ** (retries - 1))))
+
+def with_retry(max_retries: int = 3, delay: float = 1.0, max_total_time: float = 60.0):
+    """
+    Réessaie les erreurs transitoires (connexion SMTP/IMAP perdue, erreur réseau) que
+    send_email et retrieve_emails laissent remonter ; les autres erreurs y sont converties
+    en résultat d'échec. Les appels HTTP Unipile sont réessayés par l'adaptateur urllib3
+    de leur session, pas par ce décorateur.
+    """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
+            deadline = time.monotonic() + max_total_time
             while True:
                 try:
                     return func(*args, **kwargs)
-                except requests.HTTPError as e:
-                    status_code = e.response.status_code if hasattr(e, 'response') else 0
-                    if status_code in (400, 401, 403, 422):
-                        logger.error(f"Erreur HTTP {status_code} non réessayable: {e}")
-                        raise
-                    retries += 1
-                    if retries > max_retries:
-                        logger.error(f"Échec après {max_retries} tentatives - Erreur HTTP {status_code}: {e}")
-                        raise
-                    logger.warning(f"Tentative {retries}/{max_retries} échouée - Erreur HTTP {status_code}: {e}")
-                    time.sleep(delay * (2 ** (retries - 1)))
-                except (requests.ConnectionError, requests.Timeout) as e:
-                    retries += 1
-                    if retries > max_retries:
-                        logger.error(f"Échec après {max_retries} tentatives - Erreur de connexion: {e}")
-                        raise
-                    logger.warning(f"Tentative {retries}/{max_retries} échouée - Erreur de connexion: {e}")
-                    time.sleep(delay * (2 ** (retries - 1)))
                 except Exception as e:
                     retries += 1
                     if retries > max_retries:
-                        logger.error(f"Échec après {max_retries} tentatives: {e}")
+                        logger.error("Échec après %d tentatives: %s", max_retries, e)
                         raise
-                    logger.warning(f"Tentative {retries}/{max_retries} échouée: {e}")
-                    time.sleep(delay)
+                    sleep_for = _backoff_delay(delay, retries)
+                    if time.monotonic() + sleep_for > deadline:
+                        logger.error("Budget de %ss dépassé: %s", max_total_time, e)
+                        raise
+                    logger.warning("Tentative %d/%d échouée: %s", retries, max_retries, e)
+                    time.sleep(sleep_for)
         return wrapper
     return decorator
 
 # --- WhatsApp Core Logic ---
+# Connexions keep-alive conservées par hôte : les envois en rafale (threads) réutilisent
+# le même pool au lieu de rouvrir TCP + TLS à chaque requête
+HTTP_POOL_MAXSIZE = 20
+
 class UniPileWhatsAppClient:
-    def __init__(self, api_key: str, dsn: str):
+    def __init__(self, api_key: str, dsn: str, account_id: str):
         self.base_url = f"https://{dsn}/api/v1"
+        self.account_id = account_id
         self.headers = {"X-API-KEY": api_key, "Content-Type": "application/json", "Accept": "application/json"}
+        # Session persistante : connexions keep-alive réutilisées, en-têtes fixés une fois
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Les réessais HTTP sont gérés par urllib3 dans l'adaptateur (Retry-After respecté) ;
+        # raise_on_status=False rend la dernière réponse pour que raise_for_status lève HTTPError
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset(["GET", "POST"]),
+                      respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Cache des IDs de contact : 1 h pour un contact trouvé, 60 s pour le repli @c.us
+        self._contact_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._fallback_cache = TTLCache(maxsize=1024, ttl=60)
+        self._cache_lock = threading.Lock()
+
+    def _forget_contact(self, phone: str) -> None:
+        with self._cache_lock:
+            self._contact_cache.pop(phone, None)
+            self._fallback_cache.pop(phone, None)
 
-    @with_retry()
     def get_contact_id(self, phone: str) -> str:
+        with self._cache_lock:
+            cached = self._contact_cache.get(phone) or self._fallback_cache.get(phone)
+        if cached:
+            return cached
         url = f"{self.base_url}/contacts"
-        params = {"account_id": settings.whatsapp.account_id, "msisdn": phone}
+        params = {"account_id": self.account_id, "msisdn": phone}
         try:
-            logger.debug(f"Recherche du contact Unipile pour {phone}")
-            resp = requests.get(url, params=params, headers=self.headers, timeout=10)
+            logger.debug("Recherche du contact Unipile pour %s", phone)
+            resp = self.session.get(url, params=params, timeout=10)
             resp.raise_for_status()
             data = resp.json().get("data", [])
             if not data:
-                logger.warning(f"Aucun contact Unipile trouvé pour {phone}, utilisation du format standard @c.us")
+                logger.warning("Aucun contact Unipile trouvé pour %s, utilisation du format standard @c.us", phone)
+                with self._cache_lock:
+                    self._fallback_cache[phone] = f"{phone}@c.us"
                 return f"{phone}@c.us"
             contact_id = data[0]["id"]
-            logger.debug(f"ID de contact Unipile trouvé pour {phone}: {contact_id}")
+            logger.debug("ID de contact Unipile trouvé pour %s: %s", phone, contact_id)
+            with self._cache_lock:
+                self._contact_cache[phone] = contact_id
             return contact_id
         except Exception as e:
-            logger.error(f"Erreur lors de la recherche du contact Unipile pour {phone}: {e}. Utilisation de {phone}@c.us")
+            logger.error("Erreur lors de la recherche du contact Unipile pour %s: %s. Utilisation de %s@c.us", phone, e, phone)
             return f"{phone}@c.us" # Fallback
 
-    @with_retry()
     def send_message(self, phone: str, text: str) -> Dict[str, Any]:
         whatsapp_id = self.get_contact_id(phone)
-        payload = {"account_id": settings.whatsapp.account_id, "text": text, "attendees_ids": [whatsapp_id]}
+        payload = {"account_id": self.account_id, "text": text, "attendees_ids": [whatsapp_id]}
         url = f"{self.base_url}/chats"
-        logger.debug(f"Envoi d'un message WhatsApp Unipile à {whatsapp_id}")
-        resp = requests.post(url, json=payload, headers=self.headers, timeout=15)
+        logger.debug("Envoi d'un message WhatsApp Unipile à %s", whatsapp_id)
+        resp = self.session.post(url, json=payload, timeout=15)
+        if resp.status_code == 404:
+            self._forget_contact(phone) # ID de contact périmé : nouvelle recherche au prochain envoi
         resp.raise_for_status()
         return resp.json()
 
-    @with_retry()
     def send_message_to_existing_chat(self, chat_id: str, text: str) -> Dict[str, Any]:
         url = f"{self.base_url}/chats/{chat_id}/messages"
         payload = {"text": text}
-        logger.debug(f"Envoi d'un message WhatsApp Unipile au chat {chat_id}")
-        resp = requests.post(url, json=payload, headers=self.headers, timeout=15)
+        logger.debug("Envoi d'un message WhatsApp Unipile au chat %s", chat_id)
+        resp = self.session.post(url, json=payload, timeout=15)
         resp.raise_for_status()
         return resp.json()
 
+_whatsapp_clients: Dict[tuple, UniPileWhatsAppClient] = {}
+
 def get_whatsapp_client() -> UniPileWhatsAppClient:
     api_key = settings.api_keys.unipile
     dsn = settings.whatsapp.unipile_dsn
+    account_id = settings.whatsapp.account_id
     if not api_key or not dsn:
         logger.error("Clé API Unipile ou DSN manquant dans la configuration.")
         raise ValueError("Configuration Unipile incomplète.")
-    return UniPileWhatsAppClient(api_key, dsn)
+    # Un client (et donc une session HTTP) par configuration, réutilisé entre les appels
+    key = (api_key, dsn, account_id)
+    client = _whatsapp_clients.get(key)
+    if client is None:
+        client = _whatsapp_clients.setdefault(key, UniPileWhatsAppClient(api_key, dsn, account_id))
+    return client
+
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' -().\\/:')
+_NON_DIGIT_RE = re.compile(r'\D')
 
 def format_phone_number(phone_number: str) -> str:
     if not phone_number: return ""
-    cleaned = phone_number.strip()
-    for char in [" ", "-", "(", ")", ".", "/", "\\", ":"]:
-        cleaned = cleaned.replace(char, "")
-    if ":" in cleaned: cleaned = cleaned.split(":")[-1].strip()
+    cleaned = phone_number.strip().translate(_PHONE_STRIP_TABLE)
     if cleaned.startswith('+'): cleaned = cleaned[1:]
-    digits = ''.join(ch for ch in cleaned if ch.isdigit())
+    digits = _NON_DIGIT_RE.sub('', cleaned)
     if digits.startswith('00'): digits = digits[2:]
     if not digits:
-        logger.error(f"Numéro invalide (aucun chiffre): '{phone_number}'")
+        logger.error("Numéro invalide (aucun chiffre): '%s'", phone_number)
         return ""
-    logger.debug(f"Numéro formaté: '{phone_number}' -> '{digits}'")
+    logger.debug("Numéro formaté: '%s' -> '%s'", phone_number, digits)
     return digits
 
 # --- Email Core Logic ---
+# Mode aperçu de retrieve_emails : octets du corps demandés au serveur par message
+PREVIEW_BYTES = 1024
+_BYTES_PARSER = BytesParser()
+
+def _decode_bytes(payload: bytes, charset: str) -> str:
+    # bytes.decode résout déjà le codec via le cache du registre codecs (avec raccourcis C
+    # pour utf-8/latin-1) ; seul le repli sur un charset inconnu est ajouté ici
+    try:
+        return payload.decode(charset, 'replace')
+    except LookupError: # Charset inconnu annoncé par l'expéditeur
+        return payload.decode('utf-8', 'replace')
+
+def _group_fetch_response(msg_data: List[Any]) -> Dict[bytes, bytes]:
+    """
+    Regroupe la réponse d'un FETCH multi-messages par ID. Chaque section arrive en tuple
+    (préfixe, contenu) ; seul le premier préfixe d'un message commence par son ID, les
+    sections suivantes (ex. BODY[TEXT] après BODY[HEADER]) sont concaténées au message courant.
+    """
+    raw_by_id: Dict[bytes, bytes] = {}
+    current_id = None
+    for item in msg_data:
+        if not isinstance(item, tuple):
+            continue
+        prefix = item[0].lstrip()
+        if prefix[:1].isdigit():
+            current_id = prefix.split(None, 1)[0]
+            raw_by_id[current_id] = item[1]
+        elif current_id is not None:
+            raw_by_id[current_id] += item[1]
+    return raw_by_id
+
+_HTML_TAG_RE = re.compile(r'<(?:html|body|div|br)\b', re.IGNORECASE)
+
+# Lecture des pièces jointes par blocs multiples de 57 octets : chaque bloc s'encode
+# en lignes base64 complètes de 76 caractères, sans garder le fichier brut en mémoire.
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+def _build_attachment_part(file_path: str) -> MIMENonMultipart:
+    filename = os.path.basename(file_path)
+    part = MIMENonMultipart("application", "octet-stream")
+    part["Content-Transfer-Encoding"] = "base64"
+    # Forme mot-clé : nom de fichier encodé RFC 2231 si non ASCII, en-tête écrit une seule fois
+    part.add_header("Content-Disposition", "attachment", filename=filename)
+    encoded_chunks = []
+    with open(file_path, "rb") as fp:
+        for chunk in iter(functools.partial(fp.read, ATTACHMENT_CHUNK_SIZE), b""):
+            encoded_chunks.append(base64.encodebytes(chunk).decode("ascii"))
+    part.set_payload("".join(encoded_chunks))
+    return part
+
 class EmailClient:
     def __init__(self, username: str, password: str, smtp_host: str, smtp_port: int, 
                  imap_host: str, imap_port: int, sender_name: Optional[str], use_tls: bool):
@@ -137,7 +236,81 @@ class EmailClient:
         self.imap_port = imap_port
         self.sender_name = sender_name
         self.use_tls = use_tls
-        logger.debug(f"Client Email initialisé pour {username} (SMTP: {smtp_host}:{smtp_port}, IMAP: {imap_host}:{imap_port})")
+        # Connexions SMTP/IMAP authentifiées conservées entre les appels (voir _get_smtp/_get_imap)
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._imap: Optional[imaplib.IMAP4_SSL] = None
+        self._lock = threading.RLock()
+        atexit.register(self.close)
+        logger.debug("Client Email initialisé pour %s (SMTP: %s:%s, IMAP: %s:%s)", username, smtp_host, smtp_port, imap_host, imap_port)
+
+    def __enter__(self) -> "EmailClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_smtp()
+            self._close_imap()
+
+    def _close_smtp(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def _close_imap(self) -> None:
+        if self._imap is not None:
+            try:
+                self._imap.logout()
+            except Exception:
+                pass
+            self._imap = None
+
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Retourne la connexion SMTP en cache si elle répond encore, sinon se reconnecte."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except Exception:
+                pass
+            self._close_smtp()
+        logger.debug("Connexion SMTP à %s:%s", self.smtp_host, self.smtp_port)
+        if self.smtp_port == 465:
+            server = smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30)
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+            if self.use_tls: server.starttls()
+        try:
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _get_imap(self) -> imaplib.IMAP4_SSL:
+        """Retourne la connexion IMAP en cache si elle répond encore, sinon se reconnecte."""
+        if self._imap is not None:
+            try:
+                if self._imap.noop()[0] == 'OK':
+                    return self._imap
+            except Exception:
+                pass
+            self._close_imap()
+        logger.debug("Connexion IMAP à %s:%s pour %s", self.imap_host, self.imap_port, self.username)
+        imap = imaplib.IMAP4_SSL(self.imap_host, self.imap_port)
+        try:
+            imap.login(self.username, self.password)
+        except Exception:
+            imap.shutdown()
+            raise
+        self._imap = imap
+        return imap
 
     def get_formatted_sender(self) -> str:
         return formataddr((self.sender_name, self.username)) if self.sender_name else self.username
@@ -154,45 +327,44 @@ class EmailClient:
         msg["Subject"] = subject
         if cc: msg["Cc"] = ", ".join(cc)
         
-        body_type = "html" if any(tag in body.lower() for tag in ["<html", "<body", "<div", "<br"]) else "plain"
+        body_type = "html" if _HTML_TAG_RE.search(body) else "plain"
         msg.attach(MIMEText(body, body_type))
 
         if attachments:
             for file_path in attachments:
-                if not os.path.exists(file_path):
-                    logger.warning(f"Pièce jointe introuvable, ignorée: {file_path}")
-                    continue
                 try:
-                    with open(file_path, "rb") as fp:
-                        part = MIMEApplication(fp.read(), Name=os.path.basename(file_path))
-                    part["Content-Disposition"] = f'attachment; filename="{os.path.basename(file_path)}"'
-                    msg.attach(part)
-                    logger.debug(f"Pièce jointe ajoutée: {file_path}")
+                    msg.attach(_build_attachment_part(file_path))
+                    logger.debug("Pièce jointe ajoutée: %s", file_path)
+                except OSError as e: # Fichier absent ou illisible : un seul open() au lieu de exists() + open()
+                    logger.warning("Pièce jointe introuvable ou illisible, ignorée: %s (%s)", file_path, e)
                 except Exception as e:
-                    logger.error(f"Erreur lors de l'ajout de la pièce jointe {file_path}: {e}")
+                    logger.error("Erreur lors de l'ajout de la pièce jointe %s: %s", file_path, e)
                     # Continue without this attachment
 
-        all_recipients = list(to)
-        if cc: all_recipients.extend(cc)
-        if bcc: all_recipients.extend(bcc)
+        all_recipients = [*to, *(cc or ()), *(bcc or ())]
 
         try:
-            logger.debug(f"Connexion SMTP à {self.smtp_host}:{self.smtp_port}")
-            if self.smtp_port == 465:
-                with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, timeout=30) as server:
-                    server.login(self.username, self.password)
-                    server.send_message(msg, from_addr=self.username, to_addrs=all_recipients)
-            else:
-                with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30) as server:
-                    if self.use_tls: server.starttls()
-                    server.login(self.username, self.password)
+            with self._lock:
+                try:
+                    server = self._get_smtp()
                     server.send_message(msg, from_addr=self.username, to_addrs=all_recipients)
-            logger.info(f"Email envoyé à {len(all_recipients)} destinataires, sujet: {subject}")
-            return {"success": True, "to": to, "cc": cc or [], "bcc": bcc or [], "subject": subject, "attachment_count": len(attachments) if attachments else 0}
+                except Exception:
+                    self._close_smtp() # Connexion dans un état incertain : on repartira d'une nouvelle
+                    raise
+            logger.info("Email envoyé à %s destinataires, sujet: %s", len(all_recipients), subject)
+            return {"success": True, "to": to, "cc": cc or [], "bcc": bcc or [], "subject": subject, "total_recipients": len(all_recipients), "attachment_count": len(attachments) if attachments else 0}
         except smtplib.SMTPAuthenticationError as e:
             err_msg = f"Authentification SMTP échouée pour {self.username}: {e}"
             logger.error(err_msg)
             return {"success": False, "error": err_msg}
+        except smtplib.SMTPServerDisconnected:
+            raise # Connexion perdue (déjà fermée ci-dessus) : réessayée par with_retry
+        except smtplib.SMTPException as e: # Refus du serveur (destinataire, données...) : définitif
+            err_msg = f"Erreur SMTP lors de l'envoi: {e}"
+            logger.error(err_msg)
+            return {"success": False, "error": err_msg}
+        except OSError:
+            raise # Erreur réseau transitoire : réessayée par with_retry
         except Exception as e:
             err_msg = f"Erreur SMTP lors de l'envoi: {e}"
             logger.error(err_msg, exc_info=True)
@@ -202,7 +374,7 @@ class EmailClient:
         if not header_value: return ""
         decoded_parts = decode_header(str(header_value))
         return "".join(
-            part.decode(encoding or 'utf-8', 'replace') if isinstance(part, bytes) else part
+            _decode_bytes(part, encoding or 'utf-8') if isinstance(part, bytes) else part
             for part, encoding in decoded_parts
         )
 
@@ -212,47 +384,64 @@ class EmailClient:
             return dt.astimezone(timezone.utc).isoformat() if dt else date_str
         except: return date_str
 
+    def _decode_part(self, part: email.message.Message) -> str:
+        try:
+            payload = part.get_payload(decode=True)
+            charset = part.get_content_charset() or 'utf-8'
+            return _decode_bytes(payload, charset)
+        except Exception as e:
+            logger.warning("Erreur décodage partie email: %s", e)
+            return ""
+
+    def _extract_parts(self, email_msg: email.message.Message) -> Tuple[str, List[str]]:
+        """
+        Parcourt l'arbre MIME une seule fois : retourne le corps (HTML de préférence,
+        sinon texte brut) et les noms des pièces jointes.
+        """
+        if not email_msg.is_multipart():
+            if email_msg.get_content_type() in ('text/plain', 'text/html'):
+                return self._decode_part(email_msg), []
+            return "", []
+
+        html_part = None
+        plain_part = None
+        attachments_info = []
+        for part in email_msg.walk():
+            cd = part.get("Content-Disposition")
+            if cd and "attachment" in cd.lower():
+                filename = part.get_filename()
+                if filename:
+                    attachments_info.append(self._decode_header_value(filename))
+                continue
+            content_type = part.get_content_type()
+            if content_type == 'text/html':
+                if html_part is None: html_part = part
+            elif content_type == 'text/plain':
+                if plain_part is None: plain_part = part
+        target_part = html_part or plain_part
+        body_content = self._decode_part(target_part) if target_part is not None else ""
+        return body_content, attachments_info
+
     def _get_email_body(self, msg_part: email.message.Message) -> str:
-        content_type = msg_part.get_content_type()
-        body_content = ""
-        if msg_part.is_multipart():
-            html_part = None
-            plain_part = None
-            for part in msg_part.walk():
-                if part.get_content_type() == 'text/html':
-                    html_part = part
-                    break # Prefer HTML
-                elif part.get_content_type() == 'text/plain':
-                    plain_part = part
-            target_part = html_part or plain_part
-            if target_part:
-                try:
-                    payload = target_part.get_payload(decode=True)
-                    charset = target_part.get_content_charset() or 'utf-8'
-                    body_content = payload.decode(charset, 'replace')
-                except Exception as e:
-                    logger.warning(f"Erreur décodage partie email: {e}")
-        else: # Not multipart
-            if content_type in ['text/plain', 'text/html']:
-                try:
-                    payload = msg_part.get_payload(decode=True)
-                    charset = msg_part.get_content_charset() or 'utf-8'
-                    body_content = payload.decode(charset, 'replace')
-                except Exception as e:
-                    logger.warning(f"Erreur décodage corps email: {e}")
-        return body_content
+        return self._extract_parts(msg_part)[0]
 
     @with_retry(max_retries=2, delay=2)
     def retrieve_emails(self, folder: str = "INBOX", limit: int = 10, 
-                        unread_only: bool = False, search_query: Optional[str] = None) -> List[Dict[str, Any]]:
+                        unread_only: bool = False, search_query: Optional[str] = None,
+                        full_body: bool = False) -> List[Dict[str, Any]]:
+        """
+        Liste les emails les plus récents du dossier.
+        Par défaut, seuls les en-têtes et les PREVIEW_BYTES premiers octets du corps sont
+        téléchargés : "body" est alors un aperçu et les pièces jointes situées au-delà ne
+        sont pas listées. full_body=True télécharge et analyse les messages complets.
+        """
         emails_list = []
         try:
-            logger.debug(f"Connexion IMAP à {self.imap_host}:{self.imap_port} pour {self.username}")
-            with imaplib.IMAP4_SSL(self.imap_host, self.imap_port) as imap:
-                imap.login(self.username, self.password)
+            with self._lock:
+                imap = self._get_imap()
                 status, _ = imap.select(f'"{folder}"', readonly=True) # Use readonly for listing
                 if status != 'OK':
-                    logger.error(f"Dossier IMAP '{folder}' introuvable.")
+                    logger.error("Dossier IMAP '%s' introuvable.", folder)
                     return []
 
                 search_criteria = []
@@ -260,65 +449,85 @@ class EmailClient:
                 if search_query: search_criteria.append(search_query)
                 final_search_query = "ALL" if not search_criteria else f'({" ".join(search_criteria)})'
                 
-                logger.debug(f"Recherche IMAP avec critères: {final_search_query}")
+                logger.debug("Recherche IMAP avec critères: %s", final_search_query)
                 status, msg_ids_bytes = imap.search(None, final_search_query)
                 if status != 'OK': 
-                    logger.error(f"Erreur recherche IMAP: {final_search_query}")
+                    logger.error("Erreur recherche IMAP: %s", final_search_query)
                     return []
 
-                msg_ids = [m_id for m_id in msg_ids_bytes[0].split() if m_id] # Filter empty IDs
+                msg_ids = msg_ids_bytes[0].split() # split() sans argument ne produit jamais d'ID vide
                 msg_ids.reverse() # Most recent first
                 
-                for msg_id in msg_ids[:limit]:
-                    try:
-                        status, msg_data = imap.fetch(msg_id, "(RFC822)")
-                        if status != 'OK' or not msg_data[0] or not isinstance(msg_data[0], tuple):
-                            logger.warning(f"Impossible de récupérer l'email ID {msg_id.decode()}")
-                            continue
-                        
-                        raw_email = msg_data[0][1]
-                        email_msg = email.message_from_bytes(raw_email)
-                        
-                        attachments_info = []
-                        has_attachments = False
-                        if email_msg.is_multipart():
-                            for part in email_msg.walk():
-                                cd = part.get("Content-Disposition")
-                                if cd and "attachment" in cd.lower():
-                                    filename = part.get_filename()
-                                    if filename:
-                                        attachments_info.append(self._decode_header_value(filename))
-                                        has_attachments = True
-
-                        email_data = {
-                            "id": msg_id.decode(),
-                            "from": self._decode_header_value(email_msg['From']),
-                            "to": self._decode_header_value(email_msg['To']),
-                            "cc": self._decode_header_value(email_msg['Cc']),
-                            "subject": self._decode_header_value(email_msg['Subject']),
-                            "date": self._parse_email_date(email_msg['Date']),
-                            "body": self._get_email_body(email_msg),
-                            "has_attachments": has_attachments,
-                            "attachments": attachments_info
-                        }
-                        emails_list.append(email_data)
-                    except Exception as e:
-                        logger.error(f"Erreur traitement email ID {msg_id.decode()}: {e}", exc_info=False)
-            logger.info(f"{len(emails_list)} emails récupérés de '{folder}' pour {self.username}")
+                target_ids = msg_ids[:limit]
+                if not target_ids:
+                    logger.info("Aucun email correspondant dans '%s' pour %s", folder, self.username)
+                    return []
+
+                # Un seul FETCH pour tous les messages au lieu d'un aller-retour par message
+                fetch_query = "(RFC822)" if full_body else f"(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{PREVIEW_BYTES}>)"
+                status, msg_data = imap.fetch(b",".join(target_ids), fetch_query)
+                if status != 'OK':
+                    logger.error("Erreur FETCH IMAP pour %s emails dans '%s'", len(target_ids), folder)
+                    return []
+
+            raw_by_id = _group_fetch_response(msg_data)
+
+            for msg_id in target_ids:
+                msg_id_str = msg_id.decode()
+                try:
+                    raw_email = raw_by_id.get(msg_id)
+                    if not raw_email:
+                        logger.warning("Impossible de récupérer l'email ID %s", msg_id_str)
+                        continue
+                    
+                    email_msg = _BYTES_PARSER.parsebytes(raw_email)
+                    body_content, attachments_info = self._extract_parts(email_msg)
+
+                    email_data = {
+                        "id": msg_id_str,
+                        "from": self._decode_header_value(email_msg['From']),
+                        "to": self._decode_header_value(email_msg['To']),
+                        "cc": self._decode_header_value(email_msg['Cc']),
+                        "subject": self._decode_header_value(email_msg['Subject']),
+                        "date": self._parse_email_date(email_msg['Date']),
+                        "body": body_content,
+                        "has_attachments": bool(attachments_info),
+                        "attachments": attachments_info
+                    }
+                    emails_list.append(email_data)
+                except Exception as e:
+                    logger.error("Erreur traitement email ID %s: %s", msg_id_str, e, exc_info=False)
+            logger.info("%s emails récupérés de '%s' pour %s", len(emails_list), folder, self.username)
             return emails_list
+        except (imaplib.IMAP4.abort, OSError) as e:
+            # Connexion perdue ou erreur réseau : on repart d'une nouvelle connexion via with_retry
+            logger.warning("Connexion IMAP perdue pour %s sur %s: %s", self.username, folder, e)
+            with self._lock: self._close_imap()
+            raise
         except imaplib.IMAP4.error as e:
-            logger.error(f"Erreur IMAP pour {self.username} sur {folder}: {e}")
+            logger.error("Erreur IMAP pour %s sur %s: %s", self.username, folder, e)
+            with self._lock: self._close_imap()
             return [] # Return empty list on IMAP error
         except Exception as e:
-            logger.error(f"Erreur inattendue récupération emails pour {self.username}: {e}", exc_info=True)
+            logger.error("Erreur inattendue récupération emails pour %s: %s", self.username, e, exc_info=True)
+            with self._lock: self._close_imap()
             return []
 
+_email_clients: Dict[tuple, EmailClient] = {}
+
 def get_email_client() -> EmailClient:
     cfg = settings.email
     if not all([cfg.username, cfg.password, cfg.smtp_host, cfg.smtp_port, cfg.imap_host, cfg.imap_port]):
         logger.error("Configuration email incomplète dans les paramètres.")
         raise ValueError("Configuration email (SMTP/IMAP) incomplète.")
-    return EmailClient(username=cfg.username, password=cfg.password, 
-                       smtp_host=cfg.smtp_host, smtp_port=cfg.smtp_port, 
-                       imap_host=cfg.imap_host, imap_port=cfg.imap_port, 
-                       sender_name=cfg.sender_name, use_tls=cfg.use_tls) 
\ No newline at end of file
+    # Un client par configuration pour conserver ses connexions SMTP/IMAP entre les appels
+    key = (cfg.username, cfg.password, cfg.smtp_host, cfg.smtp_port,
+           cfg.imap_host, cfg.imap_port, cfg.sender_name, cfg.use_tls)
+    client = _email_clients.get(key)
+    if client is None:
+        client = _email_clients.setdefault(key, EmailClient(
+            username=cfg.username, password=cfg.password, 
+            smtp_host=cfg.smtp_host, smtp_port=cfg.smtp_port, 
+            imap_host=cfg.imap_host, imap_port=cfg.imap_port, 
+            sender_name=cfg.sender_name, use_tls=cfg.use_tls))
+    return client 
\ No newline at end of file
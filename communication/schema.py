@@ -47,4 +47,5 @@ class EmailRetrieveSchema(BaseModel):
     folder: str = Field("INBOX", description="Dossier à consulter (ex: INBOX, SENT)")
     limit: int = Field(10, description="Nombre maximum d'emails à récupérer", ge=1, le=50)
     unread_only: bool = Field(False, description="Ne récupérer que les emails non lus")
-    search_query: Optional[str] = Field(None, description="Critère de recherche (ex: FROM someone@example.com)") 
\ No newline at end of file
+    search_query: Optional[str] = Field(None, description="Critère de recherche (ex: FROM someone@example.com)")
+    full_body: bool = Field(False, description="Télécharger les messages complets : corps entier et noms des pièces jointes (plus lent). Sinon, aperçu du corps sans pièces jointes")
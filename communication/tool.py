@@ -45,8 +45,8 @@ def envoyer_message_whatsapp(phone_number: str, message: str, account_id: Option
         return f"Erreur: Numéro de téléphone '{phone_number}' invalide après formatage: '{cleaned_phone}'."
 
     # Use provided account_id or default from settings
-    # Note: The UniPileWhatsAppClient in core.py uses settings.whatsapp.account_id directly.
-    # If a per-call account_id is needed, the client or core function needs adjustment.
+    # Note: get_whatsapp_client passes settings.whatsapp.account_id to the client constructor.
+    # If a per-call account_id is needed, get_whatsapp_client needs adjustment.
     # For now, this tool relies on the globally configured account_id.
 
     try:
@@ -124,7 +124,7 @@ def envoyer_email(to: List[str], subject: str, body: str,
         result = client.send_email(to, subject, body, cc, bcc, attachments)
         if result["success"]:
             attach_info = f" avec {result['attachment_count']} pièce(s) jointe(s)" if result['attachment_count'] > 0 else ""
-            return f"Email envoyé à {len(result['to'] + result['cc'] + result['bcc'])} destinataire(s){attach_info}. Sujet: {subject}"
+            return f"Email envoyé à {result['total_recipients']} destinataire(s){attach_info}. Sujet: {subject}"
         return f"Échec de l'envoi de l'email: {result.get('error', 'Erreur inconnue')}"
     except ValueError as ve: # Configuration error
         logger.error(f"Erreur de configuration Email: {ve}")
@@ -135,7 +135,8 @@ def envoyer_email(to: List[str], subject: str, body: str,
 
 @register(name="recuperer_emails", args_schema=EmailRetrieveSchema)
 def recuperer_emails(folder: str = "INBOX", limit: int = 10, 
-                     unread_only: bool = False, search_query: Optional[str] = None) -> str:
+                     unread_only: bool = False, search_query: Optional[str] = None,
+                     full_body: bool = False) -> str:
     """
     Récupère les emails d'un compte en utilisant IMAP.
 
@@ -144,6 +145,8 @@ def recuperer_emails(folder: str = "INBOX", limit: int = 10,
         limit: Nombre maximum d'emails à récupérer.
         unread_only: Si True, ne récupère que les emails non lus.
         search_query: Critères de recherche IMAP avancés (ex: 'FROM "foo@example.com" SINCE 01-Jan-2023').
+        full_body: Si True, télécharge les messages complets (corps entier et pièces jointes listées) ;
+            sinon seul un aperçu du corps est récupéré et les pièces jointes ne sont pas listées.
 
     Returns:
         Liste formatée des emails trouvés ou message d'erreur/information.
@@ -151,26 +154,27 @@ def recuperer_emails(folder: str = "INBOX", limit: int = 10,
     logger.info(f"Tool 'recuperer_emails' appelé pour dossier: {folder}, limite: {limit}")
     try:
         client = get_email_client()
-        emails = client.retrieve_emails(folder, limit, unread_only, search_query)
+        emails = client.retrieve_emails(folder, limit, unread_only, search_query, full_body=full_body)
         if not emails:
             return f"Aucun email trouvé dans le dossier '{folder}' avec les critères spécifiés."
         
-        output = f"Emails récupérés de '{folder}' ({len(emails)}):\n\n"
+        parts = [f"Emails récupérés de '{folder}' ({len(emails)}):\n\n"]
         for i, mail in enumerate(emails, 1):
-            output += f"--- Email {i} ---\n"
-            output += f"ID: {mail.get('id')}\n"
-            output += f"De: {mail.get('from', 'N/A')}\n"
-            output += f"À: {mail.get('to', 'N/A')}\n"
-            if mail.get('cc'): output += f"Cc: {mail.get('cc')}\n"
-            output += f"Sujet: {mail.get('subject', '(Pas de sujet)')}\n"
-            output += f"Date: {mail.get('date', 'N/A')}\n"
+            parts.append(f"--- Email {i} ---\n")
+            parts.append(f"ID: {mail.get('id')}\n")
+            parts.append(f"De: {mail.get('from', 'N/A')}\n")
+            parts.append(f"À: {mail.get('to', 'N/A')}\n")
+            if mail.get('cc'): parts.append(f"Cc: {mail.get('cc')}\n")
+            parts.append(f"Sujet: {mail.get('subject', '(Pas de sujet)')}\n")
+            parts.append(f"Date: {mail.get('date', 'N/A')}\n")
             if mail.get('has_attachments') and mail.get('attachments'):
-                output += f"Pièces jointes: {", ".join(mail['attachments'])}\n"
+                parts.append(f"Pièces jointes: {', '.join(mail['attachments'])}\n")
             
-            body_preview = mail.get('body', '')[:250]
-            if len(mail.get('body', '')) > 250: body_preview += "..."
-            output += f"Extrait du corps:\n{body_preview}\n\n"
-        return output.strip()
+            body = mail.get('body', '')
+            body_preview = body[:250]
+            if len(body) > 250: body_preview += "..."
+            parts.append(f"Extrait du corps:\n{body_preview}\n\n")
+        return "".join(parts).strip()
     except ValueError as ve: # Configuration error
         logger.error(f"Erreur de configuration Email: {ve}")
         return f"Erreur de configuration Email: {ve}"
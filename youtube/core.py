@@ -1,15 +1,22 @@
 """
 Core functionality for YouTube tools.
 """
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any
 from app.utils.settings import get_settings
 from app.utils.logging import get_logger
-from .utils import extract_video_id, format_transcript
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Timeouts (connexion, lecture) en secondes pour les appels RapidAPI
+REQUEST_TIMEOUT = (3.05, 15)
+# Connexions keep-alive conservées vers l'hôte RapidAPI (un seul hôte, un seul pool)
+HTTP_POOL_MAXSIZE = 20
+
 class YouTubeError(Exception):
     """Base exception for YouTube operations."""
     pass
@@ -18,6 +25,9 @@ class YouTubeAPIError(YouTubeError):
     """Raised when the YouTube API returns an error."""
     pass
 
+# Imported after the exceptions: utils (and schema, through utils) import YouTubeError from here
+from .utils import extract_video_id, format_transcript
+
 class YouTubeCore:
     """
     Core class for YouTube operations.
@@ -38,6 +48,16 @@ class YouTubeCore:
             "x-rapidapi-host": "youtube-v2.p.rapidapi.com",
             "x-rapidapi-key": self.api_key
         }
+        # Clé masquée calculée une fois pour les logs de debug
+        self._masked_key = f"{'*' * max(0, len(self.api_key) - 4)}{self.api_key[-4:]}"
+        # Session persistante : connexions keep-alive réutilisées, en-têtes fixés une fois
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset(["GET"]),
+                      respect_retry_after_header=True, raise_on_status=False)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE,
+                                                   max_retries=retry))
     
     def _make_api_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -55,20 +75,22 @@ class YouTubeCore:
         """
         try:
             # Log API request (with masked key)
-            masked_key = f"{'*' * (len(self.api_key) - 4)}{self.api_key[-4:]}"
-            self.logger.debug(f"Making API request to {endpoint} with key: {masked_key}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Making API request to %s with key: %s", endpoint, self._masked_key)
             
-            response = requests.get(
+            response = self.session.get(
                 f"https://youtube-v2.p.rapidapi.com/{endpoint}",
-                headers=self.headers,
-                params=params
+                params=params,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code != 200:
-                raise YouTubeAPIError(f"API request failed with status code: {response.status_code}")
-                
+            response.raise_for_status()
             return response.json()
             
+        except requests.exceptions.HTTPError as e:
+            response = e.response
+            raise YouTubeAPIError(
+                f"API request failed with status code: {response.status_code} - {response.text[:200]}"
+            )
         except requests.exceptions.RequestException as e:
             raise YouTubeAPIError(f"API request failed: {str(e)}")
     
@@ -80,7 +102,7 @@ class YouTubeCore:
             video_url: URL of the YouTube video
             
         Returns:
-            str: Video transcript or error message
+            str: Video transcript
             
         Raises:
             YouTubeError: If the video URL is invalid
@@ -88,27 +110,48 @@ class YouTubeCore:
         """
         try:
             video_id = extract_video_id(video_url)
-            self.logger.info(f"Fetching transcript for video: {video_id}")
+        except YouTubeError as e:
+            self.logger.error("YouTube error: %s", e)
+            raise
+        return self.get_transcript_by_id(video_id)
+
+    def get_transcript_by_id(self, video_id: str) -> str:
+        """
+        Get the transcript of a YouTube video from its already extracted ID.
+        
+        Args:
+            video_id: 11-character YouTube video ID
+            
+        Returns:
+            str: Video transcript
+            
+        Raises:
+            YouTubeAPIError: If the API request fails
+        """
+        try:
+            self.logger.info("Fetching transcript for video: %s", video_id)
             
             data = self._make_api_request("video/subtitles", {"video_id": video_id})
             
             if "subtitles" not in data or not data["subtitles"]:
-                self.logger.warning(f"No subtitles found for video: {video_id}")
+                self.logger.warning("No subtitles found for video: %s", video_id)
                 return "Aucune transcription disponible pour cette vidéo"
                 
-            transcript = format_transcript(data["subtitles"])
+            # The API payload is only used here: release the segments as soon as they are joined
+            transcript = format_transcript(data.pop("subtitles"), consume=True)
             
-            self.logger.info(f"Successfully retrieved transcript ({len(transcript)} chars)")
+            self.logger.info("Successfully retrieved transcript (%s chars)", len(transcript))
             return transcript
             
-        except YouTubeError as e:
-            self.logger.error(f"YouTube error: {str(e)}")
-            return f"Erreur: {str(e)}"
-            
+        # Errors propagate to the caller instead of being returned as "Erreur..." strings
         except YouTubeAPIError as e:
-            self.logger.error(f"API error: {str(e)}")
-            return f"Erreur API: {str(e)}"
+            self.logger.error("API error: %s", e)
+            raise
+            
+        except YouTubeError as e:
+            self.logger.error("YouTube error: %s", e)
+            raise
             
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            return f"Erreur inattendue: {str(e)}" 
\ No newline at end of file
+            self.logger.error("Unexpected error: %s", e, exc_info=True)
+            raise 
\ No newline at end of file
@@ -2,7 +2,9 @@
 Schema definitions for YouTube tools.
 """
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
+from .core import YouTubeError
+from .utils import extract_video_id
 
 class TranscriptRequest(BaseModel):
     """
@@ -13,6 +15,20 @@ class TranscriptRequest(BaseModel):
         description="URL of the YouTube video (formats: youtube.com/watch?v=ID, youtu.be/ID, or direct ID)"
     )
 
+    @validator("url")
+    def check_url(cls, v: str) -> str:
+        # Same compiled pattern as the extractor; the match is memoized, so video_id reuses it
+        try:
+            extract_video_id(v)
+        except YouTubeError as e:
+            raise ValueError(str(e))
+        return v
+
+    @property
+    def video_id(self) -> str:
+        """Video ID extracted from url (cached lookup, no second regex scan)."""
+        return extract_video_id(self.url)
+
 class TranscriptResponse(BaseModel):
     """
     Response model for video transcript.
@@ -28,4 +44,8 @@ class TranscriptResponse(BaseModel):
     error: Optional[str] = Field(
         None,
         description="Error message if the operation failed"
-    ) 
\ No newline at end of file
+    )
+
+    class Config:
+        # Immutable once built; also accepted (deprecated) by pydantic v2
+        frozen = True 
\ No newline at end of file
@@ -1,14 +1,35 @@
 """
 YouTube tool declarations.
 """
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field
 from ai_agent.app.tools.registry import register
 from .core import YouTubeCore, YouTubeError, YouTubeAPIError
 from .schema import TranscriptRequest, TranscriptResponse
 
-# Initialize core functionality
-youtube = YouTubeCore()
+# Core functionality, created on first use so importing the registry stays cheap
+_youtube: Optional[YouTubeCore] = None
+
+def _get_youtube() -> YouTubeCore:
+    global _youtube
+    if _youtube is None:
+        _youtube = YouTubeCore()
+    return _youtube
+
+# Responses are built from values this module controls: skip pydantic validation
+# (model_construct on pydantic v2, construct on v1)
+_build_response = (TranscriptResponse.model_construct if hasattr(TranscriptResponse, "model_construct")
+                   else TranscriptResponse.construct)
+
+@lru_cache(maxsize=128)
+def _error_response(message: str) -> TranscriptResponse:
+    """Failure response; frozen, so repeated messages (e.g. rate limiting) reuse one instance."""
+    return _build_response(success=False, transcript=None, error=message)
+
+def _err(e: Exception) -> str:
+    """Exception message without going through Exception.__str__ when args[0] is already a str."""
+    return e.args[0] if e.args and isinstance(e.args[0], str) else repr(e)
 
 @register(name="youtube_transcript")
 def get_video_transcript(request: TranscriptRequest) -> TranscriptResponse:
@@ -30,28 +51,16 @@ def get_video_transcript(request: TranscriptRequest) -> TranscriptResponse:
         >>> print(response.transcript if response.success else response.error)
     """
     try:
-        transcript = youtube.get_transcript(request.url)
-        
-        # Check if the response is an error message
-        if transcript.startswith("Erreur"):
-            return TranscriptResponse(
-                success=False,
-                error=transcript
-            )
-            
-        return TranscriptResponse(
+        return _build_response(
             success=True,
-            transcript=transcript
+            transcript=_get_youtube().get_transcript_by_id(request.video_id)
         )
         
-    except (YouTubeError, YouTubeAPIError) as e:
-        return TranscriptResponse(
-            success=False,
-            error=str(e)
-        )
+    except YouTubeAPIError as e:
+        return _error_response(f"Erreur API: {_err(e)}")
+        
+    except YouTubeError as e:
+        return _error_response(f"Erreur: {_err(e)}")
         
     except Exception as e:
-        return TranscriptResponse(
-            success=False,
-            error=f"Erreur inattendue: {str(e)}"
-        ) 
\ No newline at end of file
+        return _error_response(f"Erreur inattendue: {_err(e)}") 
\ No newline at end of file
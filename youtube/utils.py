@@ -1,9 +1,53 @@
 """
 Utility functions for YouTube operations.
 """
+import re
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 from .core import YouTubeError
 
+# Compiled once at import: watch?v= (v= anywhere in the query), youtu.be/, /shorts/ and /embed/
+# URLs, with or without scheme, www. or m. prefix. Anchored on a youtube.com / youtu.be host;
+# the ID is exactly 11 chars (the lookahead rejects longer tails).
+_VIDEO_ID_RE = re.compile(
+    r'^(?:https?://)?(?:(?:www|m)\.)?'
+    r'(?:youtube\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/)|youtu\.be/)'
+    r'([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])'
+)
+_BARE_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+# Canonical prefixes handled by slicing; each handler receives the URL tail after its prefix
+_PREFIX_HANDLERS = {
+    "https://www.youtube.com/watch?v=": lambda tail: tail.split("&", 1)[0],
+    "https://youtu.be/": lambda tail: tail.split("?", 1)[0],
+    "https://www.youtube.com/shorts/": lambda tail: tail.split("?", 1)[0],
+}
+_KNOWN_PREFIXES = tuple(_PREFIX_HANDLERS)
+# (prefix, prefix length, handler) resolved once so the hot loop does no len() or dict iteration
+_PREFIX_TABLE = tuple((prefix, len(prefix), handler) for prefix, handler in _PREFIX_HANDLERS.items())
+_GET_TEXT = itemgetter("text")
+# Longer inputs are rejected before any parsing (and never enter the lru_cache)
+MAX_URL_LENGTH = 2048
+
+@lru_cache(maxsize=4096)
+def _match_video_id(url: str) -> Optional[str]:
+    """
+    Non-raising matcher shared by extract_video_id and validate_video_url.
+    Pure, so memoized; returns None when the input is neither a known URL nor a bare ID.
+    """
+    # Fast paths: bare ID and canonical URLs, no regex needed
+    if len(url) == 11 and _BARE_ID_RE.fullmatch(url):
+        return url
+    if url.startswith(_KNOWN_PREFIXES):
+        for prefix, prefix_len, handler in _PREFIX_TABLE:
+            if url.startswith(prefix):
+                video_id = handler(url[prefix_len:])
+                if len(video_id) == 11 and _BARE_ID_RE.fullmatch(video_id):
+                    return video_id
+                break
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
 def extract_video_id(url: str) -> str:
     """
     Extract the video ID from a YouTube URL.
@@ -22,18 +66,16 @@ def extract_video_id(url: str) -> str:
         'dQw4w9WgXcQ'
         >>> extract_video_id("https://youtu.be/dQw4w9WgXcQ")
         'dQw4w9WgXcQ'
+        >>> extract_video_id("https://www.youtube.com/shorts/dQw4w9WgXcQ")
+        'dQw4w9WgXcQ'
     """
     if not url:
         raise YouTubeError("URL cannot be empty")
-            
-    if url.startswith("https://www.youtube.com/watch?v="):
-        return url.split("v=")[1].split("&")[0]
-        
-    elif url.startswith("https://youtu.be/"):
-        return url.split("youtu.be/")[1]
-        
+    if len(url) > MAX_URL_LENGTH:
+        raise YouTubeError("URL too long")
+    video_id = _match_video_id(url)
     # If no recognized format, assume the URL is already an ID
-    return url
+    return video_id if video_id is not None else url
 
 def validate_video_url(url: str) -> bool:
     """
@@ -45,23 +87,45 @@ def validate_video_url(url: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    try:
-        extract_video_id(url)
-        return True
-    except YouTubeError:
-        return False
+    return bool(url) and len(url) <= MAX_URL_LENGTH and _match_video_id(url) is not None
 
-def format_transcript(transcript_data: list) -> str:
+def format_transcript(transcript_data: list, consume: bool = False) -> str:
     """
     Format transcript data into a readable string.
     
     Args:
         transcript_data: List of transcript segments
+        consume: If True, empty transcript_data once formatted so the segment dicts
+            (text plus timings/metadata) can be freed before the caller moves on
             
     Returns:
         str: Formatted transcript text
     """
     if not transcript_data:
         return ""
-        
-    return " ".join([segment["text"] for segment in transcript_data]) 
\ No newline at end of file
+    # Short transcripts (a single segment, typical of Shorts) need no join at all;
+    # for two segments and more str.join stays faster than concatenation in CPython
+    if len(transcript_data) == 1:
+        text = transcript_data[0]["text"]
+    else:
+        text = " ".join(map(_GET_TEXT, transcript_data))
+    if consume:
+        transcript_data.clear()
+    return text
+
+def format_transcripts_batch(transcripts: list) -> list:
+    """
+    Format several transcripts in one pass.
+    
+    Args:
+        transcripts: List of transcripts, each a list of segments (dicts with a "text" key)
+            or a list of already extracted segment texts
+            
+    Returns:
+        list: One formatted transcript string per input transcript
+    """
+    join = " ".join
+    return [
+        join(segments if segments and isinstance(segments[0], str) else map(_GET_TEXT, segments))
+        for segments in transcripts
+    ]